@@ -5,7 +5,13 @@ This script demonstrates the key features of the system
 import sys
 import os
 from pathlib import Path
+import re
 import time
+import asyncio
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
 
 # Add src to path
 current_dir = Path(__file__).parent
@@ -15,15 +21,93 @@ sys.path.insert(0, str(src_dir))
 import logging
 from core.config import Config
 from ingestion.document_processor import DocumentProcessor
-from utils.chunking import ChunkingAndEmbeddingPipeline
-from retrieval.vector_store import VectorStore
-from retrieval.retriever import SectionAwareRetriever
-from generation.answer_generator import AnswerGenerator
-from utils.duplicate_detection import DuplicateDetector
+
+# Spawned extraction workers re-import this module, so the embedding, vector
+# store, generation and reranking stacks are imported in the classes that use them
+import demo_workers
 
 # Configure logging for demo
 logging.basicConfig(level=logging.WARNING)  # Reduce log noise for demo
 
+# Queries exercised by the retrieval demo; prefetched when the demo starts
+FIXED_QUERIES = [
+    ("General Query", "What is this research about?"),
+    ("Methods Query", "What methodology was used?"),
+    ("Results Query", "What were the main findings?"),
+    ("Figures Query", "What do the figures show?")
+]
+
+class RerankingRetriever:
+    """Retriever wrapper that reorders over-fetched results with a cross-encoder"""
+    
+    def __init__(self, retriever, overfetch=4, model_name="ms-marco-TinyBERT-L-2-v2"):
+        self.retriever = retriever
+        self.overfetch = overfetch
+        self.ranker = None
+        try:
+            from flashrank import Ranker, RerankRequest
+        except ImportError:
+            return
+        
+        try:
+            # Downloads the model on first use, so it can fail offline
+            self.ranker = Ranker(model_name=model_name)
+            self.rerank_request = RerankRequest
+        except Exception as e:
+            logging.warning(f"Reranker unavailable, using retriever order: {e}")
+    
+    def retrieve(self, query, top_k=5, **kwargs):
+        """Retrieve overfetch * top_k candidates and keep the top_k after reranking"""
+        if not self.ranker:
+            return self.retriever.retrieve(query, top_k=top_k, **kwargs)
+        
+        results = self.retriever.retrieve(query, top_k=top_k * self.overfetch, **kwargs)
+        if len(results) <= 1:
+            return results
+        
+        passages = [{"id": i, "text": r.chunk.content} for i, r in enumerate(results)]
+        ranked = self.ranker.rerank(self.rerank_request(query=query, passages=passages))
+        return [results[p["id"]] for p in ranked[:top_k]]
+    
+    def __getattr__(self, name):
+        # Everything other than retrieve goes straight to the wrapped retriever
+        return getattr(self.retriever, name)
+
+def _pause(prompt):
+    """Prompt the user, or return None without waiting when stdin is not a terminal"""
+    return input(prompt) if sys.stdin.isatty() else None
+
+class QueryCache:
+    """Small thread-safe LRU cache keyed by normalized query text"""
+    
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(query, *args):
+        """Build a cache key that ignores case and whitespace differences"""
+        return (re.sub(r"\s+", " ", query.strip().lower()),) + args
+    
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
 class ResearchNavigatorDemo:
     """Demonstration of Research Literature Navigator capabilities"""
     
@@ -35,15 +119,41 @@ class ResearchNavigatorDemo:
         print("📚 Initializing system components...")
         
         try:
+            from utils.chunking import ChunkingAndEmbeddingPipeline
+            from retrieval.vector_store import VectorStore
+            from retrieval.retriever import SectionAwareRetriever
+            from generation.answer_generator import AnswerGenerator
+            from utils.duplicate_detection import DuplicateDetector
+            
             Config.ensure_directories()
             
             self.document_processor = DocumentProcessor()
             self.chunking_pipeline = ChunkingAndEmbeddingPipeline()
             self.vector_store = VectorStore()
             self.retriever = SectionAwareRetriever(self.vector_store)
-            self.answer_generator = AnswerGenerator(self.retriever)
+            self.answer_generator = AnswerGenerator(RerankingRetriever(self.retriever))
             self.duplicate_detector = DuplicateDetector(self.vector_store)
             
+            # Background pool for retrievals that can run ahead of the demo step
+            self._executor = ThreadPoolExecutor(max_workers=4)
+            self._prefetched = {}
+            self._prefetched_duplicates = None
+            
+            # PDF listing, refreshed only when the papers directory changes
+            self._pdf_files = []
+            self._pdf_dir_mtime = None
+            
+            # Repeated demo runs reuse earlier retrievals and answers
+            self._retrieval_cache = QueryCache()
+            self._answer_cache = QueryCache()
+            
+            # Load embedding weights now rather than inside the first demo step
+            print("🔥 Warming up embedding model...")
+            self._warm_up()
+            
+            # Start the retrieval demo's queries while the menu is on screen
+            self._prefetch_retrievals()
+            
             print("✅ System initialized successfully!")
             
         except Exception as e:
@@ -51,6 +161,47 @@ class ResearchNavigatorDemo:
             print("Please ensure .env file is configured with API keys")
             sys.exit(1)
     
+    def _warm_up(self):
+        """Run a throwaway retrieval so the encoder is loaded before the demos start"""
+        try:
+            self.retriever.retrieve("warmup", top_k=1)
+        except Exception as e:
+            # An empty collection is fine here; the model has still been loaded
+            logging.debug(f"Warm-up retrieval failed: {e}")
+    
+    def _retrieve(self, query, top_k=3):
+        """Retrieve through the query cache"""
+        key = QueryCache.key(query, top_k)
+        results = self._retrieval_cache.get(key)
+        if results is None:
+            results = self.retriever.retrieve(query, top_k=top_k)
+            if results:
+                self._retrieval_cache.put(key, results)
+        return results
+    
+    def _generate_answer(self, query, top_k=5, **kwargs):
+        """Generate an answer through the query cache"""
+        key = QueryCache.key(query, top_k, tuple(sorted(kwargs.items())))
+        result = self._answer_cache.get(key)
+        if result is None:
+            result = self.answer_generator.generate_answer(query=query, top_k=top_k, **kwargs)
+            if result and result.answer:
+                self._answer_cache.put(key, result)
+        return result
+    
+    def _list_pdfs(self):
+        """List PDFs in the papers directory, rescanning only when its mtime changes"""
+        papers_dir = Path(Config.PAPERS_DIR)
+        try:
+            mtime = os.stat(papers_dir).st_mtime
+        except FileNotFoundError:
+            return []
+        
+        if mtime != self._pdf_dir_mtime:
+            self._pdf_files = list(papers_dir.glob("*.pdf"))
+            self._pdf_dir_mtime = mtime
+        return self._pdf_files
+    
     def show_system_status(self):
         """Display current system status"""
         print("\n📊 System Status")
@@ -67,9 +218,7 @@ class ResearchNavigatorDemo:
                     print(f"   - {section.title()}: {count}")
             
             # Check available PDFs
-            papers_dir = Path(Config.PAPERS_DIR)
-            pdf_files = list(papers_dir.glob("*.pdf"))
-            print(f"🗂️ PDF files available: {len(pdf_files)}")
+            print(f"🗂️ PDF files available: {len(self._list_pdfs())}")
             
         except Exception as e:
             print(f"❌ Error getting system status: {e}")
@@ -80,42 +229,60 @@ class ResearchNavigatorDemo:
         print("-" * 40)
         
         papers_dir = Path(Config.PAPERS_DIR)
-        pdf_files = list(papers_dir.glob("*.pdf"))
+        pdf_files = self._list_pdfs()
         
         if not pdf_files:
             print("❌ No PDF files found for processing demo")
             print(f"Please add PDF files to: {papers_dir}")
             return False
         
-        # Process first available PDF
-        test_file = pdf_files[0]
-        print(f"📖 Processing: {test_file.name}")
+        print(f"📖 Processing {len(pdf_files)} PDF file(s)...")
         
         try:
-            # Process document
-            processed_doc = self.document_processor.process_document(str(test_file))
+            # pdfplumber text extraction is CPU bound, so parse PDFs in separate processes.
+            # Spawn rather than fork: prefetch threads may be inside torch or tokenizers
+            # right now, and a forked child can inherit their held locks and deadlock.
+            workers = min(os.cpu_count() or 1, len(pdf_files))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=demo_workers.init_document_worker
+            ) as executor:
+                processed_docs = list(executor.map(
+                    demo_workers.process_document,
+                    map(str, pdf_files)
+                ))
+            
+            processed_docs = [doc for doc in processed_docs if doc]
             
-            if processed_doc:
-                print(f"✅ Successfully processed document")
+            if not processed_docs:
+                print("❌ Document processing failed")
+                return False
+            
+            print(f"✅ Successfully processed {len(processed_docs)}/{len(pdf_files)} documents")
+            for processed_doc in processed_docs:
                 print(f"   📝 Title: {processed_doc.metadata.title}")
                 print(f"   👥 Authors: {', '.join(processed_doc.metadata.authors[:3])}...")
                 print(f"   📄 Chunks created: {len(processed_doc.chunks)}")
-                
-                # Create embeddings and add to vector store
-                print("🔢 Creating embeddings...")
-                chunks = self.chunking_pipeline.process_single_document(processed_doc)
-                
-                print("💾 Adding to vector database...")
-                success = self.vector_store.add_documents(chunks)
-                
-                if success:
-                    print(f"✅ Added {len(chunks)} chunks to database")
-                    return True
-                else:
-                    print("❌ Failed to add to database")
-                    return False
+            
+            # Embed every document, then write them in a single bulk insert
+            print("🔢 Creating embeddings...")
+            all_chunks = []
+            for processed_doc in processed_docs:
+                all_chunks.extend(self.chunking_pipeline.process_single_document(processed_doc))
+            
+            print("💾 Adding to vector database...")
+            success = self.vector_store.add_documents(all_chunks)
+            
+            if success:
+                # Cached and prefetched retrievals and answers predate the new chunks
+                self._discard_prefetched()
+                self._retrieval_cache.clear()
+                self._answer_cache.clear()
+                print(f"✅ Added {len(all_chunks)} chunks to database")
+                return True
             else:
-                print("❌ Document processing failed")
+                print("❌ Failed to add to database")
                 return False
                 
         except Exception as e:
@@ -127,19 +294,15 @@ class ResearchNavigatorDemo:
         print("\n🔍 Retrieval System Demo")
         print("-" * 40)
         
-        # Test different types of queries
-        test_queries = [
-            ("General Query", "What is this research about?"),
-            ("Methods Query", "What methodology was used?"),
-            ("Results Query", "What were the main findings?"),
-            ("Figures Query", "What do the figures show?")
-        ]
+        # Queries are independent, so issue them all at once
+        all_results = asyncio.run(self._retrieve_all([q for _, q in FIXED_QUERIES], top_k=3))
         
-        for query_type, query in test_queries:
+        for (query_type, query), results in zip(FIXED_QUERIES, all_results):
             print(f"\n📋 {query_type}: '{query}'")
             
             try:
-                results = self.retriever.retrieve(query, top_k=3)
+                if isinstance(results, Exception):
+                    raise results
                 
                 if results:
                     print(f"   ✅ Found {len(results)} results")
@@ -158,6 +321,47 @@ class ResearchNavigatorDemo:
         
         return True
     
+    async def _retrieve_all(self, queries, top_k=3):
+        """Run retrieval for several queries concurrently, reusing prefetched results"""
+        loop = asyncio.get_running_loop()
+        prefetched, self._prefetched = self._prefetched, {}
+        tasks = [
+            asyncio.wrap_future(prefetched[(query, top_k)]) if (query, top_k) in prefetched
+            else loop.run_in_executor(
+                self._executor, lambda q=query: self._retrieve(q, top_k=top_k)
+            )
+            for query in queries
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _prefetch_retrievals(self, top_k=3):
+        """Start the fixed retrieval queries in the background"""
+        self._prefetched = {
+            (query, top_k): self._executor.submit(self._retrieve, query, top_k=top_k)
+            for _, query in FIXED_QUERIES
+        }
+    
+    def _discard_prefetched(self):
+        """Drop prefetched retrievals and duplicate analysis, waiting for any still running"""
+        prefetched, self._prefetched = self._prefetched, {}
+        futures = list(prefetched.values())
+        if self._prefetched_duplicates:
+            futures.append(self._prefetched_duplicates)
+            self._prefetched_duplicates = None
+        for future in futures:
+            future.cancel()
+        wait(futures)
+    
+    def _analyze_duplicates(self):
+        """Duplicate statistics and clusters for the current collection"""
+        stats = self.duplicate_detector.get_duplicate_statistics()
+        duplicates = self.duplicate_detector.detect_duplicates_in_collection()
+        return stats, duplicates
+    
+    def _prefetch_duplicates(self):
+        """Start the duplicate analysis in the background"""
+        self._prefetched_duplicates = self._executor.submit(self._analyze_duplicates)
+    
     def demo_answer_generation(self):
         """Demonstrate answer generation with citations"""
         print("\n💡 Answer Generation Demo")
@@ -170,7 +374,7 @@ class ResearchNavigatorDemo:
         print("\n🤖 Generating comprehensive answer...")
         
         try:
-            result = self.answer_generator.generate_answer(
+            result = self._generate_answer(
                 query=test_query,
                 top_k=5,
                 include_evidence_grounding=True
@@ -210,8 +414,9 @@ class ResearchNavigatorDemo:
         try:
             print("🔍 Analyzing collection for duplicates...")
             
-            # Get duplicate statistics
-            stats = self.duplicate_detector.get_duplicate_statistics()
+            # Usually already computed while the earlier demos ran
+            future, self._prefetched_duplicates = self._prefetched_duplicates, None
+            stats, duplicates = future.result() if future else self._analyze_duplicates()
             
             print(f"📊 Duplicate Analysis Results:")
             print(f"   🔢 Total clusters: {stats.get('total_duplicate_clusters', 0)}")
@@ -224,9 +429,6 @@ class ResearchNavigatorDemo:
                 for section, data in stats['section_breakdown'].items():
                     print(f"      - {section}: {data['clusters']} clusters")
             
-            # Try to detect actual duplicates
-            duplicates = self.duplicate_detector.detect_duplicates_in_collection()
-            
             if duplicates:
                 print(f"\n🔍 Found {len(duplicates)} duplicate clusters:")
                 
@@ -263,7 +465,7 @@ class ResearchNavigatorDemo:
                 
                 print("\n🤖 Thinking...")
                 
-                result = self.answer_generator.generate_answer(
+                result = self._generate_answer(
                     query=query,
                     top_k=3
                 )
@@ -287,7 +489,7 @@ class ResearchNavigatorDemo:
                 print(f"❌ Error: {e}")
     
     def run_complete_demo(self):
-        """Run the complete demonstration"""
+        """Run the complete demonstration, overlapping background work with the earlier demos"""
         print("\n🎬 Starting Complete Demo")
         print("=" * 60)
         
@@ -309,8 +511,14 @@ class ResearchNavigatorDemo:
                 else:
                     print(f"⚠️ {demo_name} demo had issues")
                 
+                if demo_func == self.demo_document_processing:
+                    # The collection is final now; run the retrieval queries and the duplicate
+                    # analysis while the user reads and while answers are generated
+                    self._prefetch_retrievals()
+                    self._prefetch_duplicates()
+                
                 # Wait for user input
-                input(f"\n⏸️ Press Enter to continue to next demo...")
+                _pause(f"\n⏸️ Press Enter to continue to next demo...")
                 
             except Exception as e:
                 print(f"❌ {demo_name} demo failed: {e}")
@@ -319,7 +527,7 @@ class ResearchNavigatorDemo:
         print("\n🎉 All demos completed!")
         
         # Offer interactive session
-        response = input("\n💬 Would you like to try the interactive query session? (y/N): ").strip().lower()
+        response = (_pause("\n💬 Would you like to try the interactive query session? (y/N): ") or "").strip().lower()
         
         if response in ['y', 'yes']:
             self.interactive_query_session()
@@ -344,7 +552,8 @@ def main():
         print("2. Quick interactive session")
         print("3. System status only")
         
-        choice = input("\nSelect option (1-3): ").strip()
+        # Non-interactive runs go straight to the complete demo
+        choice = (_pause("\nSelect option (1-3): ") or "1").strip()
         
         if choice == "1":
             demo.run_complete_demo()
@@ -0,0 +1,26 @@
+"""
+PDF extraction workers for demo.py's process pool
+
+Kept out of demo.py so that a spawned worker imports only the document processor,
+not the embedding, vector store and generation stacks.
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+src_dir = Path(__file__).parent / "src"
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from ingestion.document_processor import DocumentProcessor
+
+# Per-process DocumentProcessor, created by the pool initializer
+_worker_processor = None
+
+def init_document_worker():
+    """Create the DocumentProcessor once per worker process"""
+    global _worker_processor
+    _worker_processor = DocumentProcessor()
+
+def process_document(path):
+    return _worker_processor.process_document(path)
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the simplified Flask app
+
+    gunicorn -c gunicorn_conf.py simple_app:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Threads overlap concurrent Gemini calls within a worker. The collection and
+# search index live in each worker's memory, and an upload only updates the
+# worker that served it, so a single worker is the default. WEB_CONCURRENCY
+# raises it for read-mostly deployments (2 * CPUs + 1 is the usual ceiling).
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Gemini answers can take a while
+timeout = 180
+
+# Load documents and the index once in the master; workers share the pages copy-on-write
+preload_app = True
+
+def post_fork(server, worker):
+    """Threads and database handles don't survive fork; recreate them per worker"""
+    from simple_app import nav
+    nav.after_fork()
@@ -3,8 +3,37 @@ Quick start script for Research Literature Navigator
 """
 import sys
 import os
+import json
+import importlib.util
 from pathlib import Path
 
+# Records a successful dependency check so later runs can skip it
+DEPENDENCY_CACHE_FILE = ".quickstart_cache.json"
+
+# Distributions whose import name is not simply the name with "-" replaced by "_"
+IMPORT_NAMES = {"python-dotenv": "dotenv"}
+
+def dependency_cache_key(current_dir):
+    """Key the dependency check on the interpreter and requirements.txt"""
+    requirements_mtime = (current_dir / "requirements.txt").stat().st_mtime
+    return f"{sys.version}|{requirements_mtime}"
+
+def dependencies_cached(current_dir):
+    """Check whether the last run already verified dependencies for this key"""
+    try:
+        with open(current_dir / DEPENDENCY_CACHE_FILE, "r") as f:
+            return json.load(f).get("key") == dependency_cache_key(current_dir)
+    except (OSError, ValueError):
+        return False
+
+def cache_dependencies(current_dir):
+    """Remember that dependencies are satisfied for the current key"""
+    try:
+        with open(current_dir / DEPENDENCY_CACHE_FILE, "w") as f:
+            json.dump({"key": dependency_cache_key(current_dir)}, f)
+    except OSError:
+        pass
+
 def setup_environment():
     """Set up the environment for running the application"""
     print("🚀 Research Literature Navigator - Quick Start")
@@ -61,26 +90,35 @@ def setup_environment():
     # Check if dependencies are installed
     print("📦 Checking dependencies...")
     
-    missing_deps = []
+    if dependencies_cached(current_dir):
+        print("✅ All dependencies are installed (cached)")
+        return True
+    
     required_packages = [
         "streamlit", "langchain", "chromadb", "sentence-transformers",
         "pdfplumber", "numpy", "pandas", "python-dotenv"
     ]
     
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-        except ImportError:
-            missing_deps.append(package)
+    # find_spec only locates the package; it does not run its __init__
+    missing_deps = [
+        package for package in required_packages
+        if importlib.util.find_spec(IMPORT_NAMES.get(package, package.replace("-", "_"))) is None
+    ]
     
     if missing_deps:
         print(f"❌ Missing dependencies: {', '.join(missing_deps)}")
         print("Installing dependencies...")
         
+        if (current_dir / "requirements.lock").exists():
+            # Pre-resolved, hash-pinned set (see tools/freeze_lock.py); no resolver run needed
+            install_args = ["--no-deps", "--require-hashes", "-r", "requirements.lock"]
+        else:
+            install_args = ["-r", "requirements.txt"]
+        
         try:
             import subprocess
             result = subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
+                sys.executable, "-m", "pip", "install", *install_args
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
@@ -95,6 +133,7 @@ def setup_environment():
     else:
         print("✅ All dependencies are installed")
     
+    cache_dependencies(current_dir)
     return True
 
 def create_sample_content():
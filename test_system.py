@@ -3,6 +3,8 @@ Test script for the Research Literature Navigator system
 """
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -30,6 +32,13 @@ class SystemTester:
         """Initialize test components"""
         logger.info("Initializing Research Literature Navigator test suite...")
         
+        # Processed documents and their chunks, shared by the tests that need them
+        self._doc_cache = {}
+        self._chunk_cache = {}
+        # Tests in a tier run concurrently; held while filling a cache or writing to the vector store
+        self._cache_lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        
         # Ensure configuration is valid
         try:
             Config.ensure_directories()
@@ -49,6 +58,22 @@ class SystemTester:
         
         logger.info("✅ System components initialized successfully")
     
+    def _process_cached(self, path):
+        """Process a PDF once per run, however many tests use it"""
+        path = str(path)
+        with self._cache_lock:
+            if path not in self._doc_cache:
+                self._doc_cache[path] = self.document_processor.process_document(path)
+            return self._doc_cache[path]
+    
+    def _chunks_cached(self, path, processed_doc):
+        """Chunk and embed a processed document once per run"""
+        path = str(path)
+        with self._cache_lock:
+            if path not in self._chunk_cache:
+                self._chunk_cache[path] = self.chunking_pipeline.process_single_document(processed_doc)
+            return self._chunk_cache[path]
+    
     def test_document_processing(self):
         """Test document processing pipeline"""
         logger.info("🧪 Testing document processing...")
@@ -68,7 +93,7 @@ class SystemTester:
         
         try:
             # Process document
-            processed_doc = self.document_processor.process_document(str(test_file))
+            processed_doc = self._process_cached(test_file)
             
             if processed_doc:
                 logger.info(f"✅ Successfully processed document: {processed_doc.metadata.title}")
@@ -99,14 +124,14 @@ class SystemTester:
         try:
             # Process a document
             test_file = pdf_files[0]
-            processed_doc = self.document_processor.process_document(str(test_file))
+            processed_doc = self._process_cached(test_file)
             
             if not processed_doc:
                 logger.error("❌ Could not process document for chunking test")
                 return False
             
             # Test chunking and embedding
-            chunks = self.chunking_pipeline.process_single_document(processed_doc)
+            chunks = self._chunks_cached(test_file, processed_doc)
             
             if chunks:
                 logger.info(f"✅ Successfully created {len(chunks)} chunks with embeddings")
@@ -145,11 +170,12 @@ class SystemTester:
                 
                 if pdf_files:
                     test_file = pdf_files[0]
-                    processed_doc = self.document_processor.process_document(str(test_file))
+                    processed_doc = self._process_cached(test_file)
                     
                     if processed_doc:
-                        chunks = self.chunking_pipeline.process_single_document(processed_doc)
-                        success = self.vector_store.add_documents(chunks)
+                        chunks = self._chunks_cached(test_file, processed_doc)
+                        with self._store_lock:
+                            success = self.vector_store.add_documents(chunks)
                         
                         if success:
                             logger.info(f"✅ Successfully added {len(chunks)} chunks to vector store")
@@ -247,32 +273,44 @@ class SystemTester:
             logger.error(f"❌ Error testing duplicate detection: {e}")
             return False
     
+    def _run_test(self, test):
+        """Run one named test, logging its outcome"""
+        test_name, test_func = test
+        logger.info(f"\n📋 Running {test_name} test...")
+        try:
+            success = test_func()
+            status = "✅ PASSED" if success else "❌ FAILED"
+            logger.info(f"{test_name}: {status}")
+            return success
+        except Exception as e:
+            logger.error(f"❌ {test_name} test crashed: {e}")
+            return False
+    
     def run_full_test_suite(self):
         """Run the complete test suite"""
         logger.info("🚀 Running Research Literature Navigator test suite...")
         logger.info("=" * 60)
         
-        tests = [
-            ("Document Processing", self.test_document_processing),
-            ("Chunking & Embedding", self.test_chunking_and_embedding),
-            ("Vector Store", self.test_vector_store),
-            ("Retrieval System", self.test_retrieval),
-            ("Answer Generation", self.test_answer_generation),
-            ("Duplicate Detection", self.test_duplicate_detection)
+        # Each tier depends only on the ones before it; tests within a tier run in parallel
+        tiers = [
+            [("Document Processing", self.test_document_processing)],
+            [
+                ("Chunking & Embedding", self.test_chunking_and_embedding),
+                ("Vector Store", self.test_vector_store)
+            ],
+            [
+                ("Retrieval System", self.test_retrieval),
+                ("Answer Generation", self.test_answer_generation),
+                ("Duplicate Detection", self.test_duplicate_detection)
+            ]
         ]
         
         results = {}
         
-        for test_name, test_func in tests:
-            logger.info(f"\n📋 Running {test_name} test...")
-            try:
-                success = test_func()
-                results[test_name] = success
-                status = "✅ PASSED" if success else "❌ FAILED"
-                logger.info(f"{test_name}: {status}")
-            except Exception as e:
-                logger.error(f"❌ {test_name} test crashed: {e}")
-                results[test_name] = False
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for tier in tiers:
+                for (test_name, _), success in zip(tier, executor.map(self._run_test, tier)):
+                    results[test_name] = success
         
         # Summary
         logger.info("\n" + "=" * 60)
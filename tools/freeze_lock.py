@@ -0,0 +1,38 @@
+"""
+Generate requirements.lock, a fully pinned and hash-checked copy of requirements.txt
+
+The launchers install from the lock with --no-deps --require-hashes when it exists,
+which skips pip's dependency resolver on every setup run.
+"""
+import sys
+import subprocess
+import importlib.util
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def main():
+    """Compile requirements.txt into requirements.lock with pip-compile"""
+    if importlib.util.find_spec("piptools") is None:
+        print("❌ pip-tools is not installed. Please run: pip install pip-tools")
+        return False
+    
+    print("🔒 Resolving requirements.txt into requirements.lock...")
+    result = subprocess.run([
+        sys.executable, "-m", "piptools", "compile",
+        "--generate-hashes",
+        "--allow-unsafe",
+        "--output-file", "requirements.lock",
+        "requirements.txt"
+    ], cwd=PROJECT_ROOT)
+    
+    if result.returncode != 0:
+        print("❌ Failed to generate requirements.lock")
+        return False
+    
+    print("✅ requirements.lock written")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)